@@ -6,7 +6,9 @@ import re
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 
-_norm_re = re.compile(r"[\s\-—_]+")
+# Dashes are stripped as punctuation; ``_`` is a word character, so it is
+# mapped to a separator explicitly.
+_SEPARATOR_TABLE = str.maketrans("_", " ")
 _title_punctuation_re = re.compile(r"[^\w\s\u4e00-\u9fff]+", re.UNICODE)
 _tracking_param_re = re.compile(r"^(utm_|fbclid$|gclid$|ref$)", re.IGNORECASE)
 
@@ -14,7 +16,8 @@ _tracking_param_re = re.compile(r"^(utm_|fbclid$|gclid$|ref$)", re.IGNORECASE)
 def normalize_title(title: str) -> str:
     """Normalize an article title for identity comparisons."""
     normalized = _title_punctuation_re.sub(" ", (title or "").strip().lower())
-    return _norm_re.sub(" ", normalized).strip()
+    # split()/join collapses whitespace runs and trims, like the old \s+ pass.
+    return " ".join(normalized.translate(_SEPARATOR_TABLE).split())
 
 
 def canonical_url(link: str) -> str:
@@ -4,16 +4,49 @@ Loads settings from .env and config.yaml
 """
 
 from __future__ import annotations
+import functools
 import os
 from pathlib import Path
 import re
 from typing import Dict, List, Literal
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
-from dotenv import load_dotenv
 import yaml
 
+try:
+    # libyaml-backed loader; same safe tag set as SafeLoader.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_ENV_FILE = Path(__file__).resolve().parent / ".env"
+
+
+def _load_env_file(path: str | Path = _ENV_FILE, override: bool = False) -> None:
+    """Load plain ``KEY=VALUE`` lines from a local ``.env`` into the process."""
+    env_path = Path(path)
+    if not env_path.is_file():
+        return
+    for raw_line in env_path.read_text(encoding="utf-8-sig").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+        key, separator, value = line.partition("=")
+        key = key.strip()
+        if not separator or not key:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        if override or key not in os.environ:
+            os.environ[key] = value
+
+
 # Load local defaults without overriding explicit process/Actions settings.
-load_dotenv(encoding="utf-8", override=False)
+_load_env_file()
 
 DEFAULT_MODELSCOPE_MODEL = "Qwen/Qwen3.5-35B-A3B"
 DEFAULT_MODELSCOPE_SECONDARY_MODEL = ""
@@ -156,6 +189,8 @@ class AgihuntTrendingSettings(BaseModel):
 class Settings(BaseModel):
     """Application settings with validation"""
 
+    model_config = ConfigDict(extra="ignore")
+
     # Primary provider: ModelScope API
     api_key: str = Field(default="", description="ModelScope API Key")
     api_base_url: str = Field(
@@ -223,9 +258,6 @@ class Settings(BaseModel):
         default_factory=lambda: EnrichmentSettings()
     )
 
-    class Config:
-        extra = "ignore"
-
 
 class EnrichmentTrustedDomains(BaseModel):
     """Trusted domains for staged Tavily refill"""
@@ -299,75 +331,98 @@ class EnrichmentSettings(BaseModel):
 Settings.model_rebuild()
 
 
+# Settings field -> environment variable.  A set variable wins over
+# config.yaml; an unset one leaves the YAML value or the field default.
+_ENV_FIELDS = {
+    "api_key": "MODELSCOPE_API_KEY",
+    "api_base_url": "MODELSCOPE_BASE_URL",
+    "model": "MODELSCOPE_MODEL",
+    "modelscope_secondary_model": "MODELSCOPE_SECONDARY_MODEL",
+    "fallback_api_key": "SILICONFLOW_API_KEY",
+    "fallback_api_base_url": "SILICONFLOW_BASE_URL",
+    "fallback_model": "SILICONFLOW_MODEL",
+    "max_output": "MODELSCOPE_MAX_OUTPUT",
+    "timezone": "TIMEZONE",
+    "run_deadline_minutes": "RUN_DEADLINE_MINUTES",
+    "syft_web_app_url": "SYFT_WEB_APP_URL",
+    "syft_secret_key": "SYFT_SECRET_KEY",
+    "agihunt_api_key": "AGIHUNT_API_KEY",
+    "tavily_api_key": "TAVILY_API_KEY",
+}
+
+# Settings field -> key path in config.yaml.  Missing keys keep the default.
+_YAML_FIELDS = {
+    "sources": ("sources",),
+    "max_articles": ("limits", "max_articles"),
+    "max_summary_items": ("limits", "max_summary_items"),
+    "title_max": ("summarize", "compress", "title_max"),
+    "desc_max": ("summarize", "compress", "desc_max"),
+    "prompt_path": ("summarize", "prompt_path"),
+    "data_dir": ("output", "json_dir"),
+    "content_dir": ("output", "md_dir"),
+    "site_dir": ("output", "site_dir"),
+    "publication_root": ("output", "publication_root"),
+    "run_deadline_minutes": ("run", "deadline_minutes"),
+    "agihunt": ("agihunt",),
+    "agihunt_trending": ("agihunt_trending",),
+    "enrichment": ("enrichment",),
+}
+
+_MISSING = object()
+
+
+def _yaml_value(cfg: dict, path: tuple[str, ...]):
+    """Walk one key path, returning ``_MISSING`` when any level is absent."""
+    node = cfg
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
+
+
 def load_config(config_path: str = "config.yaml") -> Settings:
     """Load configuration from environment and YAML file"""
-
-    # Load from environment
-    env_settings = {
-        "api_key": os.getenv("MODELSCOPE_API_KEY", ""),
-        "api_base_url": os.getenv(
-            "MODELSCOPE_BASE_URL", "https://api-inference.modelscope.cn/v1"
-        ),
-        "model": os.getenv("MODELSCOPE_MODEL", DEFAULT_MODELSCOPE_MODEL),
-        "modelscope_secondary_model": os.getenv(
-            "MODELSCOPE_SECONDARY_MODEL", DEFAULT_MODELSCOPE_SECONDARY_MODEL
-        ),
-        "fallback_api_key": os.getenv("SILICONFLOW_API_KEY", ""),
-        "fallback_api_base_url": os.getenv(
-            "SILICONFLOW_BASE_URL", "https://api.siliconflow.cn/v1"
-        ),
-        "fallback_model": os.getenv("SILICONFLOW_MODEL", DEFAULT_SILICONFLOW_MODEL),
-        "max_output": int(os.getenv("MODELSCOPE_MAX_OUTPUT", "2000")),
-        "timezone": os.getenv("TIMEZONE", "Asia/Shanghai"),
-        "run_deadline_minutes": float(os.getenv("RUN_DEADLINE_MINUTES", "20")),
-        "syft_web_app_url": os.getenv("SYFT_WEB_APP_URL", ""),
-        "syft_secret_key": os.getenv("SYFT_SECRET_KEY", ""),
-        "agihunt_api_key": os.getenv("AGIHUNT_API_KEY", ""),
-        "tavily_api_key": os.getenv("TAVILY_API_KEY", ""),
-    }
+    values = {}
 
     # Load from YAML if exists
-    yaml_settings = {}
-    if Path(config_path).exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
-            output_cfg = cfg.get("output", {})
-            yaml_settings = {
-                "sources": cfg.get("sources", {}),
-                "max_articles": cfg.get("limits", {}).get("max_articles", 14),
-                "max_summary_items": cfg.get("limits", {}).get("max_summary_items", 10),
-                "title_max": cfg.get("summarize", {})
-                .get("compress", {})
-                .get("title_max", 150),
-                "desc_max": cfg.get("summarize", {})
-                .get("compress", {})
-                .get("desc_max", 300),
-                "prompt_path": cfg.get("summarize", {}).get(
-                    "prompt_path", "prompts/daily.md"
-                ),
-                "data_dir": output_cfg.get("json_dir", "data"),
-                "content_dir": output_cfg.get("md_dir", "content"),
-                "site_dir": output_cfg.get(
-                    "site_dir", output_cfg.get("docs_dir", "dist")
-                ),
-                "publication_root": output_cfg.get("publication_root", ".publication"),
-                "run_deadline_minutes": cfg.get("run", {}).get("deadline_minutes", 20),
-                "agihunt": cfg.get("agihunt", {}),
-                "agihunt_trending": cfg.get("agihunt_trending", {}),
-                "enrichment": cfg.get("enrichment", {}),
-            }
-
-    # Merge settings (env takes precedence for secrets)
-    return Settings(**{**yaml_settings, **env_settings})
-
-
-# Singleton instance
-_config: Settings | None = None
-
-
+    cfg = _read_yaml(config_path)
+    if cfg is not None:
+        for name, path in _YAML_FIELDS.items():
+            value = _yaml_value(cfg, path)
+            if value is not _MISSING:
+                values[name] = value
+        # Older configs name the site output ``docs_dir``.
+        if "site_dir" not in values:
+            legacy = _yaml_value(cfg, ("output", "docs_dir"))
+            if legacy is not _MISSING:
+                values["site_dir"] = legacy
+
+    # Merge settings (env takes precedence when set); pydantic coerces the
+    # numeric strings.
+    for name, variable in _ENV_FIELDS.items():
+        if variable in os.environ:
+            values[name] = os.environ[variable]
+    return Settings(**values)
+
+
+def _read_yaml(config_path: str) -> dict | None:
+    """Return the parsed YAML file, or None when it does not exist."""
+    try:
+        mtime_ns = Path(config_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_yaml(str(config_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(config_path: str, mtime_ns: int) -> dict:
+    """Parse one revision of a YAML file; the mtime key picks up edits."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_config() -> Settings:
-    """Get or create config singleton"""
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    """Get the process-wide config; ``get_config.cache_clear()`` reloads it."""
+    return load_config()
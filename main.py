@@ -21,6 +21,7 @@ from utils import (
     today_cn,
     save_json,
     load_json,
+    save_markdown,
 )
 from utils.run_contracts import (
     PublicationState,
@@ -46,6 +47,7 @@ from utils.story_quality import (
 from summarizer import (
     summarize_result,
     offline_summary,
+    offline_summary_result,
     test_connection,
 )
 from utils.summary_contracts import (
@@ -256,7 +258,6 @@ def stage_and_publish_run(
 ):
     """Build a complete candidate edition before changing any public artifact."""
     from build import build_site
-    from utils.storage import save_json, save_markdown
 
     summary_payload = report.get("summary")
     if summary_payload is not None:
@@ -436,8 +437,6 @@ def summarize_with_result(
     articles: list[dict], *, offline: bool, cfg, deadline_at=None
 ):
     """Return rendered content plus the structured result used to publish it."""
-    from summarizer import offline_summary_result
-
     summary_limit = max(1, int(getattr(cfg, "max_summary_items", 10)))
 
     if offline or (not cfg.api_key and not cfg.fallback_api_key):
@@ -511,7 +510,7 @@ def cmd_run(args):
     articles = dedupe(articles)
     print(f"   Remaining: {len(articles)} unique articles")
 
-    articles_dict = [a.to_dict() if isinstance(a, Article) else a for a in articles]
+    articles_dict = [article.to_dict() for article in articles]
     enrichment_result = apply_enrichment(cfg, args, articles_dict, date_str, clock)
     articles_dict = enrichment_result["articles"]
     recent_dedupe = remove_recent_exact_duplicates(
@@ -653,7 +652,7 @@ def cmd_fetch(args):
     )
 
     articles = dedupe(articles)
-    articles_dict = [a.to_dict() if isinstance(a, Article) else a for a in articles]
+    articles_dict = [article.to_dict() for article in articles]
     enrichment_result = apply_enrichment(cfg, args, articles_dict, date_str, clock)
     articles_dict = enrichment_result["articles"]
     recent_dedupe = remove_recent_exact_duplicates(
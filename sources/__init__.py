@@ -4,6 +4,7 @@ Provides centralized access to all news sources
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from time import perf_counter
 from typing import Dict, List, Type
@@ -42,6 +43,122 @@ def get_source(name: str, **kwargs) -> BaseSource | None:
     return None
 
 
+def _fetch_source(
+    name: str,
+    *,
+    max_articles: int,
+    syft_url: str,
+    syft_key: str,
+    agihunt_api_key: str,
+    agihunt_settings: AgihuntSettings | None,
+    agihunt_max_articles: int | None,
+    agihunt_trending_settings: AgihuntTrendingSettings | None,
+    agihunt_trending_max_articles: int | None,
+    reference_dt: datetime | None,
+    deadline_at: datetime | None,
+) -> tuple[List[Article], SourceRunResult]:
+    """Run one source and convert its outcome into a manifest record."""
+    if name not in REGISTRY:
+        return [], SourceRunResult(
+            source=name,
+            status="failed",
+            attempts=0,
+            duration_ms=0,
+            fetched_count=0,
+            accepted_count=0,
+            error_kind="configuration",
+            error_message="unknown enabled source",
+        )
+
+    started = perf_counter()
+    source: BaseSource | None = None
+    source_max_articles = max_articles
+    try:
+        # Special handling for Syft source
+        if name == "syft":
+            source = SyftSource(web_app_url=syft_url, secret_key=syft_key)
+        elif name == "agihunt":
+            source = AgihuntSource(
+                api_key=agihunt_api_key,
+                settings=agihunt_settings,
+            )
+            source_max_articles = (
+                agihunt_max_articles
+                if agihunt_max_articles is not None
+                else max_articles
+            )
+        elif name == "agihunt_trending":
+            source = AgihuntTrendingSource(settings=agihunt_trending_settings)
+            source_max_articles = (
+                agihunt_trending_max_articles
+                if agihunt_trending_max_articles is not None
+                else max_articles
+            )
+        else:
+            source = REGISTRY[name]()
+
+        articles = source.fetch(
+            max_articles=source_max_articles,
+            reference_dt=reference_dt,
+            deadline_at=deadline_at,
+        )
+        print(f"✅ {name}: fetched {len(articles)} articles")
+        fetched_count = getattr(source, "last_fetched_count", None)
+        fetched_count = max(int(fetched_count or 0), len(articles))
+        diagnostics = tuple(getattr(source, "last_diagnostics", ()))
+        status = getattr(source, "last_status", None) or ("ok" if articles else "empty")
+        if status == "empty" and fetched_count:
+            status = "degraded"
+            diagnostics += (
+                Diagnostic(
+                    code="source_empty_after_fetch",
+                    message="source fetched candidates but accepted none",
+                ),
+            )
+        attempts = source.last_attempts
+        if attempts == 0 and name != "agihunt":
+            attempts = 1
+        return articles, SourceRunResult(
+            source=name,
+            status=status,
+            attempts=attempts,
+            duration_ms=round((perf_counter() - started) * 1000),
+            fetched_count=fetched_count,
+            accepted_count=len(articles),
+            articles=tuple(
+                ArticleSnapshot(**article.to_dict()) for article in articles
+            ),
+            diagnostics=diagnostics,
+        )
+
+    except RunDeadlineExceeded:
+        raise
+    except Exception as error:
+        error_kind = type(error).__name__
+        print(f"❌ {name}: failed - {error_kind}")
+        source_diagnostics = tuple(
+            getattr(source, "last_diagnostics", ()) if source else ()
+        )
+        diagnostic_code = getattr(error, "diagnostic_code", "source_error")
+        return [], SourceRunResult(
+            source=name,
+            status="failed",
+            attempts=(getattr(source, "last_attempts", 0) or 1),
+            duration_ms=round((perf_counter() - started) * 1000),
+            fetched_count=int(getattr(source, "last_fetched_count", 0) or 0),
+            accepted_count=0,
+            error_kind=error_kind,
+            error_message="source execution failed; inspect protected logs",
+            diagnostics=source_diagnostics
+            + (
+                Diagnostic(
+                    code=diagnostic_code,
+                    message="source execution failed; inspect protected logs",
+                ),
+            ),
+        )
+
+
 def fetch_batch(
     enabled_sources: Dict[str, bool],
     max_articles: int = 14,
@@ -58,6 +175,10 @@ def fetch_batch(
     """
     Fetch articles from all enabled sources
 
+    Sources run concurrently on a thread pool because each one is dominated by
+    blocking network I/O. Articles and outcomes are still combined in
+    ``enabled_sources`` order so downstream dedupe and manifests stay stable.
+
     Args:
         enabled_sources: Dict mapping source name to enabled status
         max_articles: Max articles per source
@@ -73,121 +194,36 @@ def fetch_batch(
     Returns:
         Combined list of articles from all sources
     """
+    names = [name for name, enabled in enabled_sources.items() if enabled]
+    if not names:
+        return [], ()
+
     all_articles: List[Article] = []
     outcomes: list[SourceRunResult] = []
-
-    for name, enabled in enabled_sources.items():
-        if not enabled:
-            continue
-        if name not in REGISTRY:
-            outcomes.append(
-                SourceRunResult(
-                    source=name,
-                    status="failed",
-                    attempts=0,
-                    duration_ms=0,
-                    fetched_count=0,
-                    accepted_count=0,
-                    error_kind="configuration",
-                    error_message="unknown enabled source",
-                )
-            )
-            continue
-
-        started = perf_counter()
-        source: BaseSource | None = None
-        source_max_articles = max_articles
-        try:
-            # Special handling for Syft source
-            if name == "syft":
-                source = SyftSource(web_app_url=syft_url, secret_key=syft_key)
-            elif name == "agihunt":
-                source = AgihuntSource(
-                    api_key=agihunt_api_key,
-                    settings=agihunt_settings,
-                )
-                source_max_articles = (
-                    agihunt_max_articles
-                    if agihunt_max_articles is not None
-                    else max_articles
-                )
-            elif name == "agihunt_trending":
-                source = AgihuntTrendingSource(settings=agihunt_trending_settings)
-                source_max_articles = (
-                    agihunt_trending_max_articles
-                    if agihunt_trending_max_articles is not None
-                    else max_articles
-                )
-            else:
-                source = REGISTRY[name]()
-
-            articles = source.fetch(
-                max_articles=source_max_articles,
+    with ThreadPoolExecutor(
+        max_workers=len(names), thread_name_prefix="source-fetch"
+    ) as executor:
+        futures = [
+            executor.submit(
+                _fetch_source,
+                name,
+                max_articles=max_articles,
+                syft_url=syft_url,
+                syft_key=syft_key,
+                agihunt_api_key=agihunt_api_key,
+                agihunt_settings=agihunt_settings,
+                agihunt_max_articles=agihunt_max_articles,
+                agihunt_trending_settings=agihunt_trending_settings,
+                agihunt_trending_max_articles=agihunt_trending_max_articles,
                 reference_dt=reference_dt,
                 deadline_at=deadline_at,
             )
+            for name in names
+        ]
+        for future in futures:
+            articles, outcome = future.result()
             all_articles.extend(articles)
-            print(f"✅ {name}: fetched {len(articles)} articles")
-            fetched_count = getattr(source, "last_fetched_count", None)
-            fetched_count = max(int(fetched_count or 0), len(articles))
-            diagnostics = tuple(getattr(source, "last_diagnostics", ()))
-            status = getattr(source, "last_status", None) or (
-                "ok" if articles else "empty"
-            )
-            if status == "empty" and fetched_count:
-                status = "degraded"
-                diagnostics += (
-                    Diagnostic(
-                        code="source_empty_after_fetch",
-                        message="source fetched candidates but accepted none",
-                    ),
-                )
-            attempts = source.last_attempts
-            if attempts == 0 and name != "agihunt":
-                attempts = 1
-            outcomes.append(
-                SourceRunResult(
-                    source=name,
-                    status=status,
-                    attempts=attempts,
-                    duration_ms=round((perf_counter() - started) * 1000),
-                    fetched_count=fetched_count,
-                    accepted_count=len(articles),
-                    articles=tuple(
-                        ArticleSnapshot(**article.to_dict()) for article in articles
-                    ),
-                    diagnostics=diagnostics,
-                )
-            )
-
-        except RunDeadlineExceeded:
-            raise
-        except Exception as error:
-            error_kind = type(error).__name__
-            print(f"❌ {name}: failed - {error_kind}")
-            source_diagnostics = tuple(
-                getattr(source, "last_diagnostics", ()) if source else ()
-            )
-            diagnostic_code = getattr(error, "diagnostic_code", "source_error")
-            outcomes.append(
-                SourceRunResult(
-                    source=name,
-                    status="failed",
-                    attempts=(getattr(source, "last_attempts", 0) or 1),
-                    duration_ms=round((perf_counter() - started) * 1000),
-                    fetched_count=int(getattr(source, "last_fetched_count", 0) or 0),
-                    accepted_count=0,
-                    error_kind=error_kind,
-                    error_message="source execution failed; inspect protected logs",
-                    diagnostics=source_diagnostics
-                    + (
-                        Diagnostic(
-                            code=diagnostic_code,
-                            message="source execution failed; inspect protected logs",
-                        ),
-                    ),
-                )
-            )
+            outcomes.append(outcome)
 
     return all_articles, tuple(outcomes)
 
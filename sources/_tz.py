@@ -0,0 +1,7 @@
+"""Shared timezone for sources that report in Beijing local dates."""
+
+from __future__ import annotations
+
+from zoneinfo import ZoneInfo
+
+beijing_tz = ZoneInfo("Asia/Shanghai")
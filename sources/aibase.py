@@ -9,17 +9,59 @@ from datetime import datetime
 from urllib.parse import urljoin
 from typing import List
 
-from .base import BaseSource, Article
-
-# Timezone handling
-try:
-    import pytz
+import soupsieve
 
-    beijing_tz = pytz.timezone("Asia/Shanghai")
-except ImportError:
-    from datetime import timezone, timedelta
+from ._tz import beijing_tz
+from .base import BaseSource, Article
 
-    beijing_tz = timezone(timedelta(hours=8))
+_ABSOLUTE_PREFIXES = ("http://", "https://")
+_ARTICLE_PATH_HINTS = ("/daily/", "/article/", "/news/", "/post/")
+_URL_DATE_HINT_RE = re.compile(r"\d{4}[-/]\d{2}[-/]\d{2}")
+_BLANK_RE = re.compile(r"\n{3,}")
+_NON_TEXT_TAGS = frozenset({"script", "style", "noscript"})
+_CN_DATE_RE = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})号")
+_TZ_STRIP_RE = re.compile(r"\s*\+\d{2}:\d{2}|\s*Z|\s*UTC.*")
+
+# Selectors are compiled once; soup.select() would re-parse them per page.
+_TITLE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "h1",
+        "h1.entry-title",
+        ".post-title",
+        ".article-title",
+        ".title",
+        "header h1",
+    )
+)
+_TIME_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "time[datetime]",
+        "time",
+        "meta[property='article:published_time']",
+        "meta[name='pubdate']",
+        ".post-meta time",
+        ".article-meta time",
+        ".date",
+    )
+)
+_SUMMARY_AREA_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "article",
+        ".post-content",
+        ".article-content",
+        ".content",
+        "#content",
+        ".entry-content",
+        "main",
+    )
+)
+_FULL_TEXT_AREA_SELECTOR = soupsieve.compile(
+    "article, .post-content, .article-content, .content, "
+    "#content, .entry-content, main, #main, [role='main']"
+)
 
 
 class AIBaseSource(BaseSource):
@@ -65,35 +107,34 @@ class AIBaseSource(BaseSource):
         return [article]
 
     def _find_latest_link(self, soup) -> str | None:
-        """Find the latest daily article link"""
-        candidates = []
+        """Find the best-scoring daily article link in one pass"""
+        best_score = -1.0
+        best_url = None
         for a in soup.find_all("a", href=True):
             href = a.get("href", "").strip()
             if not href or href.startswith("#"):
                 continue
-            full_url = urljoin(self.BASE_URL, href)
-            if any(p in full_url for p in ["/daily/", "/article/", "/news/", "/post/"]):
-                candidates.append(
-                    {"url": full_url, "text": a.get_text(" ", strip=True)}
-                )
+            full_url = (
+                href
+                if href.startswith(_ABSOLUTE_PREFIXES)
+                else urljoin(self.BASE_URL, href)
+            )
+            if not any(p in full_url for p in _ARTICLE_PATH_HINTS):
+                continue
 
-        if not candidates:
-            return None
+            score = 0
+            if _URL_DATE_HINT_RE.search(full_url):
+                score += 10
+            if "/daily/" in full_url:
+                score += 5
+            if 10 <= len(a.get_text(" ", strip=True)) <= 100:
+                score += 3
+            score += len(full_url) / 1000.0
+            # Strict comparison keeps the first anchor among equal scores.
+            if score > best_score:
+                best_score, best_url = score, full_url
 
-        # Score and sort candidates
-        def score(c):
-            s = 0
-            if re.search(r"\d{4}[-/]\d{2}[-/]\d{2}", c["url"]):
-                s += 10
-            if "/daily/" in c["url"]:
-                s += 5
-            if 10 <= len(c["text"]) <= 100:
-                s += 3
-            s += len(c["url"]) / 1000.0
-            return s
-
-        candidates.sort(key=score, reverse=True)
-        return candidates[0]["url"]
+        return best_url
 
     def _extract_detail(
         self, link: str, *, deadline_at: datetime | None = None
@@ -104,20 +145,7 @@ class AIBaseSource(BaseSource):
             resp.raise_for_status()
             soup = self._parse_html(resp.content)
 
-            title = (
-                self._pick_text(
-                    soup,
-                    [
-                        "h1",
-                        "h1.entry-title",
-                        ".post-title",
-                        ".article-title",
-                        ".title",
-                        "header h1",
-                    ],
-                )
-                or "未找到标题"
-            )
+            title = self._pick_text(soup, _TITLE_SELECTORS) or "未找到标题"
 
             description = self._extract_summary(soup) or "无描述"
             publish_time = self._extract_time(soup) or "未知时间"
@@ -133,10 +161,10 @@ class AIBaseSource(BaseSource):
         except Exception:
             return None
 
-    def _pick_text(self, soup, selectors: list) -> str:
-        """Pick text from first matching selector"""
-        for sel in selectors:
-            for el in soup.select(sel):
+    def _pick_text(self, soup, selectors) -> str:
+        """Pick text from first matching compiled selector"""
+        for css in selectors:
+            for el in css.select(soup):
                 text = el.get_text(" ", strip=True)
                 if text and len(text) > 4:
                     return text
@@ -144,17 +172,8 @@ class AIBaseSource(BaseSource):
 
     def _extract_time(self, soup) -> str:
         """Extract publish time from page"""
-        selectors = [
-            "time[datetime]",
-            "time",
-            "meta[property='article:published_time']",
-            "meta[name='pubdate']",
-            ".post-meta time",
-            ".article-meta time",
-            ".date",
-        ]
-        for sel in selectors:
-            el = soup.select_one(sel)
+        for css in _TIME_SELECTORS:
+            el = css.select_one(soup)
             if not el:
                 continue
             if el.name == "time":
@@ -173,16 +192,8 @@ class AIBaseSource(BaseSource):
     def _extract_summary(self, soup, max_chars: int = 400) -> str:
         """Extract article summary"""
         areas = []
-        for sel in [
-            "article",
-            ".post-content",
-            ".article-content",
-            ".content",
-            "#content",
-            ".entry-content",
-            "main",
-        ]:
-            el = soup.select_one(sel)
+        for css in _SUMMARY_AREA_SELECTORS:
+            el = css.select_one(soup)
             if el:
                 areas.append(el)
 
@@ -207,25 +218,34 @@ class AIBaseSource(BaseSource):
         return (summary[: max_chars - 1] + "…") if len(summary) > max_chars else summary
 
     def _extract_full_text(self, soup) -> str:
-        """Extract full article text"""
-        area = soup.select_one(
-            "article, .post-content, .article-content, .content, "
-            "#content, .entry-content, main, #main, [role='main']"
-        )
+        """Extract full article text in one pass over its text nodes"""
+        area = _FULL_TEXT_AREA_SELECTOR.select_one(soup)
         if area:
-            text = area.get_text("\n", strip=True)
+            strings = area.strings
         else:
-            for tag in soup(["script", "style", "noscript"]):
-                tag.extract()
-            text = soup.get_text("\n", strip=True)
-        return re.sub(r"\n{3,}", "\n\n", text)
+            # Filter non-content text instead of extracting tags from the tree.
+            strings = (
+                string
+                for string in soup.strings
+                if not any(parent.name in _NON_TEXT_TAGS for parent in string.parents)
+            )
+        return "\n".join(self._normalized_lines(strings))
+
+    @staticmethod
+    def _normalized_lines(strings):
+        """Yield stripped text nodes with blank-line runs collapsed at source"""
+        for string in strings:
+            text = string.strip()
+            if not text:
+                continue
+            yield _BLANK_RE.sub("\n\n", text) if "\n\n\n" in text else text
 
     def _is_today(self, article: Article, today) -> bool:
         """Check if article is from today (Beijing time)"""
         content = article.content
 
         # Try to find date in content (format: 2025年11月8号)
-        date_match = re.search(r"(\d{4})年(\d{1,2})月(\d{1,2})号", content)
+        date_match = _CN_DATE_RE.search(content)
         if date_match:
             year, month, day = map(int, date_match.groups())
             if datetime(year, month, day).date() == today:
@@ -234,7 +254,7 @@ class AIBaseSource(BaseSource):
         # Try to parse publish_time
         publish_time = article.publish_time
         if publish_time and publish_time != "未知时间":
-            date_str = re.sub(r"\s*\+\d{2}:\d{2}|\s*Z|\s*UTC.*", "", publish_time)
+            date_str = _TZ_STRIP_RE.sub("", publish_time)
             for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%Y年%m月%d日"]:
                 try:
                     if datetime.strptime(date_str[:10], fmt).date() == today:
@@ -5,16 +5,32 @@ All sources should inherit from this class
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, tzinfo
+import os
+from pathlib import Path
 import random
+import tempfile
 import time
-from typing import Any, List
+from typing import Any, Callable, List, TypeVar
+from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 from requests.utils import get_environ_proxies
+from requests_cache import DEFAULT_IGNORED_PARAMS, CachedSession
+from selectolax.lexbor import LexborHTMLParser
 
 
-@dataclass
+_T = TypeVar("_T")
+
+
+def _is_html_page(response: requests.Response) -> bool:
+    content_type = response.headers.get("Content-Type", "")
+    return content_type.split(";", 1)[0].strip().lower() == "text/html"
+
+
+@dataclass(slots=True)
 class Article:
     """Standard article structure"""
 
@@ -56,12 +72,24 @@ class BaseSource(ABC):
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/123.0.0.0 Safari/537.36"
-        )
+        ),
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
     }
+    # Keep-alive sockets retained per host; retries stay in ``_get`` so the
+    # attempt count and run deadline remain authoritative.
+    POOL_SIZE = 16
+    # Listing pages keep their story links near the top; trailing markup is
+    # ads and footers that only add parse work.
+    MAX_PAGE_BYTES = 512_000
+    # Same-day re-runs revalidate with ETag/Last-Modified instead of
+    # downloading unchanged pages again.
+    HTTP_CACHE_TTL_SECONDS = 600
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.trust_env = False
+    def __init__(self, session: requests.Session | None = None):
+        # A caller-provided session is used as is: its proxy policy and
+        # connection-pool sizing stay the caller's responsibility.
+        self._session = session
         self.last_attempts = 0
         # Source-specific adapters can expose richer, additive run facts.  The
         # registry falls back to the returned Article count for legacy sources.
@@ -70,6 +98,48 @@ class BaseSource(ABC):
         self.last_status: str | None = None
         self.last_diagnostics: tuple[Any, ...] = ()
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, built on first use so API-only adapters never open one."""
+        if self._session is None:
+            self._session = self._new_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
+
+    @staticmethod
+    def _http_cache_dir() -> Path:
+        user_id = getattr(os, "getuid", lambda: "user")()
+        return Path(tempfile.gettempdir()) / f"daily-report-http-{user_id}"
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached source response."""
+        cls._new_session().cache.clear()
+
+    @classmethod
+    def _new_session(cls) -> requests.Session:
+        """Create a cached Session whose adapters reuse keep-alive connections."""
+        session = CachedSession(
+            str(cls._http_cache_dir()),
+            backend="filesystem",
+            expire_after=cls.HTTP_CACHE_TTL_SECONDS,
+            cache_control=True,
+            # Only HTML pages are stored; JSON APIs and feeds always go upstream.
+            filter_fn=_is_html_page,
+            # Query-string secrets (Syft) are redacted from stored requests.
+            ignored_parameters=(*DEFAULT_IGNORED_PARAMS, "secret"),
+        )
+        session.trust_env = False
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     @abstractmethod
     def fetch(
         self,
@@ -88,10 +158,113 @@ class BaseSource(ABC):
         max_attempts: int = 3,
         deadline_at: datetime | None = None,
         use_environment_proxy: bool = False,
+        stream: bool = False,
         sleep=time.sleep,
         random_value=random.random,
     ) -> requests.Response:
         """Make a bounded retryable GET without retrying configuration 4xx errors."""
+        return self._with_retries(
+            lambda request_timeout: self._send(
+                url,
+                request_timeout,
+                use_environment_proxy=use_environment_proxy,
+                stream=stream,
+            ),
+            timeout,
+            max_attempts=max_attempts,
+            deadline_at=deadline_at,
+            sleep=sleep,
+            random_value=random_value,
+        )
+
+    def _get_bytes(
+        self,
+        url: str,
+        timeout: int = 15,
+        *,
+        max_bytes: int | None = None,
+        chunk_size: int = 65_536,
+        max_attempts: int = 3,
+        deadline_at: datetime | None = None,
+        use_environment_proxy: bool = False,
+        sleep=time.sleep,
+        random_value=random.random,
+    ) -> bytes:
+        """Stream a page body and stop reading once ``max_bytes`` is reached.
+
+        Connecting and reading the body form one attempt, so a body cut off
+        mid-stream is retried under the same attempt budget and deadline.
+        """
+        limit = self.MAX_PAGE_BYTES if max_bytes is None else max_bytes
+
+        def read(request_timeout: float) -> bytes:
+            response = self._send(
+                url,
+                request_timeout,
+                use_environment_proxy=use_environment_proxy,
+                stream=True,
+            )
+            try:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size):
+                    body += chunk
+                    if len(body) >= limit:
+                        break
+                return bytes(body[:limit])
+            finally:
+                response.close()
+
+        return self._with_retries(
+            read,
+            timeout,
+            max_attempts=max_attempts,
+            deadline_at=deadline_at,
+            sleep=sleep,
+            random_value=random_value,
+        )
+
+    def _send(
+        self,
+        url: str,
+        request_timeout: float,
+        *,
+        use_environment_proxy: bool,
+        stream: bool,
+    ) -> requests.Response:
+        proxies = get_environ_proxies(url) if use_environment_proxy else {}
+        with self._cache_bypass(stream):
+            response = self.session.get(
+                url,
+                headers=self.HEADERS,
+                timeout=request_timeout,
+                proxies=proxies,
+                stream=stream,
+            )
+        if response.status_code == 429 or response.status_code >= 500:
+            if stream:
+                # The caller never receives this response; release its socket.
+                response.close()
+            response.raise_for_status()
+        return response
+
+    def _cache_bypass(self, stream: bool):
+        """Keep streamed reads out of the cache, which would load whole bodies."""
+        if stream and isinstance(self.session, CachedSession):
+            return self.session.cache_disabled()
+        return nullcontext()
+
+    def _with_retries(
+        self,
+        attempt_fn: Callable[[float], _T],
+        timeout: float,
+        *,
+        max_attempts: int,
+        deadline_at: datetime | None,
+        sleep,
+        random_value,
+    ) -> _T:
+        """Run ``attempt_fn(request_timeout)`` with bounded, deadline-aware backoff."""
         from utils.run_contracts import RunDeadlineExceeded
 
         last_error: requests.RequestException | None = None
@@ -101,16 +274,7 @@ class BaseSource(ABC):
                 timeout, deadline_at, "source fetch"
             )
             try:
-                proxies = get_environ_proxies(url) if use_environment_proxy else {}
-                response = self.session.get(
-                    url,
-                    headers=self.HEADERS,
-                    timeout=request_timeout,
-                    proxies=proxies,
-                )
-                if response.status_code == 429 or response.status_code >= 500:
-                    response.raise_for_status()
-                return response
+                return attempt_fn(request_timeout)
             except requests.RequestException as exc:
                 last_error = exc
                 response = getattr(exc, "response", None)
@@ -145,8 +309,20 @@ class BaseSource(ABC):
             raise RunDeadlineExceeded(f"run deadline exceeded during {stage}")
         return min(float(timeout), remaining)
 
+    @staticmethod
+    def _build_recent_set(
+        tz: tzinfo, days: int = 1, reference_dt: datetime | None = None
+    ) -> frozenset[str]:
+        """Return the ISO dates from ``days`` ago through today in ``tz``."""
+        today = (reference_dt or datetime.now(tz)).astimezone(tz).date()
+        return frozenset(
+            (today - timedelta(days=offset)).isoformat() for offset in range(days + 1)
+        )
+
     def _parse_html(self, content: bytes):
-        """Parse HTML content using BeautifulSoup"""
-        from bs4 import BeautifulSoup
+        """Parse HTML content using BeautifulSoup's libxml2-backed lxml builder"""
+        return BeautifulSoup(content, "lxml")
 
-        return BeautifulSoup(content, "html.parser")
+    def _parse_html_fast(self, content: bytes) -> LexborHTMLParser:
+        """Parse HTML with selectolax's Lexbor engine for CSS-only extraction"""
+        return LexborHTMLParser(content)
@@ -5,11 +5,12 @@ Fetches curated AI news from Syft newsletter via Google Apps Script
 
 from __future__ import annotations
 from typing import List
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 
-from .base import BaseSource, Article
+import requests
 
-beijing_tz = timezone(timedelta(hours=8))
+from ._tz import beijing_tz
+from .base import BaseSource, Article
 
 
 class SyftSource(BaseSource):
@@ -17,8 +18,13 @@ class SyftSource(BaseSource):
 
     name = "syft"
 
-    def __init__(self, web_app_url: str = "", secret_key: str = ""):
-        super().__init__()
+    def __init__(
+        self,
+        web_app_url: str = "",
+        secret_key: str = "",
+        session: requests.Session | None = None,
+    ):
+        super().__init__(session=session)
         self.web_app_url = web_app_url
         self.secret_key = secret_key
 
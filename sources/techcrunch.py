@@ -5,13 +5,19 @@ Fetches AI/tech news from techcrunch.com
 
 from __future__ import annotations
 import re
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 from typing import List
 
+from ._tz import beijing_tz
 from .base import BaseSource, Article
 
-# Beijing timezone
-beijing_tz = timezone(timedelta(hours=8))
+# One selector group keeps matching in selectolax's C engine; an anchor hit by
+# several groups is dropped by the canonical-URL check below.
+_STORY_ANCHOR_SELECTOR = (
+    "h1 a, h2 a, h3 a, .post-block a, .river-block a, "
+    "a[href*='/2025/'], a[href*='/2026/']"
+)
+_DATE_URL_RE = re.compile(r"/(\d{4})/(\d{2})/(\d{2})/")
 
 
 class TechCrunchSource(BaseSource):
@@ -27,55 +33,30 @@ class TechCrunchSource(BaseSource):
         deadline_at: datetime | None = None,
     ) -> List[Article]:
         """Fetch recent tech news"""
-        resp = self._get(self.BASE_URL, deadline_at=deadline_at)
-        resp.raise_for_status()
-        soup = self._parse_html(resp.content)
+        tree = self._parse_html_fast(
+            self._get_bytes(self.BASE_URL, deadline_at=deadline_at)
+        )
 
-        articles = self._parse_articles(soup, reference_dt=reference_dt)
+        # Today and yesterday in Beijing time
+        recent_dates = self._build_recent_set(
+            beijing_tz, days=1, reference_dt=reference_dt
+        )
+        articles = self._parse_articles(tree, recent_dates)
 
         # Filter to last 24-48 hours
-        filtered = [
-            a
-            for a in articles
-            if self._is_recent(a.publish_time, reference_dt=reference_dt)
-        ]
+        filtered = [a for a in articles if a.publish_time in recent_dates]
 
         return filtered[:max_articles]
 
-    def _parse_articles(
-        self, soup, reference_dt: datetime | None = None
-    ) -> List[Article]:
-        """Parse article links from homepage"""
-        selectors = [
-            "h2 a",
-            "h3 a",
-            "h1 a",
-            "article h2 a",
-            "article h3 a",
-            ".post-block a",
-            ".river-block a",
-            'a[href*="/2025/"]',
-            'a[href*="/2026/"]',
-        ]
-
-        all_links = []
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-                all_links.extend(elements)
-            except Exception:
-                continue
-
+    def _parse_articles(self, tree, recent_dates: frozenset[str]) -> List[Article]:
+        """Parse article links from homepage in one selector pass"""
         # Deduplicate by URL
         seen_urls = set()
         articles = []
 
-        for element in all_links:
-            if element.name != "a":
-                continue
-
-            title = element.get_text(strip=True)
-            link = element.get("href", "")
+        for element in tree.css(_STORY_ANCHOR_SELECTOR):
+            title = element.text(strip=True)
+            link = element.attributes.get("href") or ""
 
             # Normalize link
             if link and not link.startswith("http"):
@@ -106,9 +87,7 @@ class TechCrunchSource(BaseSource):
                     link=link,
                     description="",
                     publish_time=publish_time,
-                    priority=1
-                    if self._is_recent(publish_time, reference_dt=reference_dt)
-                    else 0,
+                    priority=1 if publish_time in recent_dates else 0,
                     source=self.name,
                     kind="lead",
                     evidence_status="unresolved",
@@ -125,27 +104,8 @@ class TechCrunchSource(BaseSource):
 
     def _extract_date_from_url(self, url: str) -> str:
         """Extract date from TechCrunch URL format"""
-        match = re.search(r"/(\d{4})/(\d{2})/(\d{2})/", url)
+        match = _DATE_URL_RE.search(url)
         if match:
             year, month, day = match.groups()
             return f"{year}-{month}-{day}"
         return ""
-
-    def _is_recent(
-        self, publish_time: str, reference_dt: datetime | None = None
-    ) -> bool:
-        """Check if article is within last 48 hours"""
-        if not publish_time or len(publish_time) != 10:
-            return False
-
-        try:
-            pub_date = datetime.strptime(publish_time, "%Y-%m-%d")
-            now = (
-                (reference_dt or datetime.now(beijing_tz))
-                .astimezone(beijing_tz)
-                .replace(tzinfo=None)
-            )
-            diff = now - pub_date
-            return diff.days <= 1
-        except Exception:
-            return False
@@ -15,12 +15,14 @@ from typing import List
 from urllib.parse import urlparse
 from xml.etree import ElementTree
 
+from ._tz import beijing_tz
 from .base import Article, BaseSource
 
 
-beijing_tz = timezone(timedelta(hours=8))
 ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
 ATOM = f"{{{ATOM_NAMESPACE}}}"
+_WHITESPACE_RE = re.compile(r"\s+")
+_DATE_URL_RE = re.compile(r"/(\d{4})/(\d{1,2})/(\d{1,2})/")
 
 
 class TheVergeSource(BaseSource):
@@ -109,7 +111,7 @@ class TheVergeSource(BaseSource):
         from bs4 import BeautifulSoup
 
         text = BeautifulSoup(unescape(value), "html.parser").get_text(" ", strip=True)
-        return re.sub(r"\s+", " ", text).strip()
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     @staticmethod
     def _is_theverge_article(link: str) -> bool:
@@ -157,7 +159,7 @@ class TheVergeSource(BaseSource):
     @staticmethod
     def _extract_date_from_url(url: str) -> str:
         """Retain compatibility with callers that inspect legacy dated URLs."""
-        match = re.search(r"/(\d{4})/(\d{1,2})/(\d{1,2})/", url)
+        match = _DATE_URL_RE.search(url)
         if not match:
             return ""
         year, month, day = match.groups()
@@ -4,13 +4,16 @@ Summarizes news articles into daily reports.
 """
 
 from __future__ import annotations
-import json
+import atexit
+import functools
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 import re
-from typing import Any
-from openai import OpenAI
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
 from config import get_config
 from utils.run_contracts import RunDeadlineExceeded
 from utils.summary_contracts import (
@@ -37,6 +40,13 @@ from utils.summary_selection import (
     select_summary_candidates_with_diagnostics,
 )
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+# Bound for connectivity probes; a healthy provider answers well within it.
+_PROBE_TIMEOUT_SECONDS = 30
+
 
 class SummaryQualityError(ValueError):
     """Raised when an LLM response is not a usable Chinese daily summary."""
@@ -67,41 +77,84 @@ def create_client(
     *,
     timeout: float | None = None,
 ) -> OpenAI:
-    """Create OpenAI-compatible client."""
-    options = {"base_url": base_url, "api_key": api_key, "max_retries": 0}
-    if timeout is not None:
-        options["timeout"] = timeout
-    return OpenAI(**options)
+    """Return the OpenAI-compatible client for a provider.
+
+    Clients are reused per ``(base_url, api_key)`` and all share one HTTP
+    connection pool, so the repair call, the next fallback provider and
+    ``test_connection`` keep their warm TLS connections.  A per-call
+    ``timeout`` yields a lightweight copy bound to the same pool.
+    """
+    client = _provider_client(base_url, api_key)
+    if timeout is None:
+        return client
+    return client.with_options(timeout=timeout)
+
+
+@functools.lru_cache(maxsize=8)
+def _provider_client(base_url: str, api_key: str) -> OpenAI:
+    # The SDK is the slowest import in the CLI; only pay for it once a client
+    # is actually needed, so ``--help``, ``build`` and offline runs skip it.
+    from openai import OpenAI
+
+    return OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        max_retries=0,
+        http_client=_shared_http_client(),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_client():
+    """Create the process-wide keep-alive pool used by every provider client."""
+    from openai import DefaultHttpxClient
+
+    # Built through the SDK so its timeout, redirect and pool-limit defaults
+    # apply without importing the HTTP library directly.
+    client = DefaultHttpxClient()
+    atexit.register(client.close)
+    return client
 
 
 def load_prompt(path: str = None) -> str:
     """Load system prompt from file"""
     cfg = get_config()
     prompt_path = Path(path or cfg.prompt_path)
-    if prompt_path.exists():
-        return prompt_path.read_text(encoding="utf-8")
-    return "你是一个专业的AI资讯编辑，请将新闻整理成简洁的中文日报。"
+    try:
+        mtime_ns = prompt_path.stat().st_mtime_ns
+    except OSError:
+        return "你是一个专业的AI资讯编辑，请将新闻整理成简洁的中文日报。"
+    return _read_prompt(str(prompt_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_prompt(path: str, mtime_ns: int) -> str:
+    """Read one revision of a prompt file; the mtime key picks up edits."""
+    return Path(path).read_text(encoding="utf-8")
 
 
 def compress_articles(articles: list[dict]) -> list[dict]:
     """Compress articles to reduce token usage"""
     cfg = get_config()
+    title_max = cfg.title_max
+    desc_max = cfg.desc_max
     compressed = []
     for index, a in enumerate(articles, 1):
+        get = a.get
         item = {
             "article_id": article_reference_id(a, index),
-            "title": (a.get("title") or "")[: cfg.title_max],
-            "description": (a.get("description") or "")[: cfg.desc_max],
+            "title": (get("title") or "")[:title_max],
+            "description": (get("description") or "")[:desc_max],
         }
-        evidence = a.get("evidence")
+        evidence = get("evidence")
         if isinstance(evidence, list):
             item["evidence"] = [
                 {
-                    "title": str(entry.get("title") or "")[: cfg.title_max],
+                    "title": str(entry.get("title") or "")[:title_max],
                     "url": str(entry.get("url") or ""),
                     "published_date": str(entry.get("published_date") or ""),
                     "snippet": str(entry.get("snippet") or entry.get("text") or "")[
-                        : cfg.desc_max
+                        :desc_max
                     ],
                 }
                 for entry in evidence[:3]
@@ -591,6 +644,32 @@ def _validate_summary_with_one_repair(
 def _provider_candidates() -> list[dict[str, str]]:
     """Build provider candidates in priority order."""
     cfg = get_config()
+    # Copies keep the memoized candidates safe from caller mutation.
+    return [
+        dict(provider)
+        for provider in _build_provider_candidates(
+            cfg.api_key,
+            cfg.api_base_url,
+            cfg.model,
+            cfg.modelscope_secondary_model,
+            cfg.fallback_api_key,
+            cfg.fallback_api_base_url,
+            cfg.fallback_model,
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=4)
+def _build_provider_candidates(
+    api_key: str,
+    api_base_url: str,
+    model: str,
+    secondary_model: str,
+    fallback_api_key: str,
+    fallback_api_base_url: str,
+    fallback_model: str,
+) -> tuple[dict[str, str], ...]:
+    """Memoized on the provider fields, so a reloaded config rebuilds it."""
     providers: list[dict[str, str]] = []
 
     def append_provider(name: str, base_url: str, api_key: str, model: str) -> None:
@@ -609,29 +688,16 @@ def _provider_candidates() -> list[dict[str, str]]:
             return
         providers.append(candidate)
 
-    if cfg.api_key:
-        append_provider(
-            "ModelScope",
-            cfg.api_base_url,
-            cfg.api_key,
-            cfg.model,
-        )
-        append_provider(
-            "ModelScope secondary",
-            cfg.api_base_url,
-            cfg.api_key,
-            cfg.modelscope_secondary_model,
-        )
+    if api_key:
+        append_provider("ModelScope", api_base_url, api_key, model)
+        append_provider("ModelScope secondary", api_base_url, api_key, secondary_model)
 
-    if cfg.fallback_api_key:
+    if fallback_api_key:
         append_provider(
-            "SiliconFlow",
-            cfg.fallback_api_base_url,
-            cfg.fallback_api_key,
-            cfg.fallback_model,
+            "SiliconFlow", fallback_api_base_url, fallback_api_key, fallback_model
         )
 
-    return providers
+    return tuple(providers)
 
 
 def summarize(
@@ -748,7 +814,8 @@ def summarize_result(
     input_fingerprint, prompt_fingerprint = fingerprint_summary_input(
         compressed, system_prompt
     )
-    user_input = json.dumps({"articles": compressed}, ensure_ascii=False, indent=2)
+    # Compact JSON: indentation only adds prompt tokens the model ignores.
+    user_input = orjson.dumps({"articles": compressed}).decode("utf-8")
     attempts: list[SummaryAttempt] = []
     errors: list[str] = []
 
@@ -915,6 +982,26 @@ def offline_summary_result(articles: list[dict], limit: int = 10):
     return result
 
 
+def _probe_provider(provider: dict[str, str]) -> str:
+    """Send one short chat request and return the non-empty reply."""
+    client = create_client(
+        provider["base_url"], provider["api_key"], timeout=_PROBE_TIMEOUT_SECONDS
+    )
+    params: dict[str, Any] = {
+        "model": provider["model"],
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "你好，请用一句话介绍自己。"},
+        ],
+        "max_tokens": 64,
+        "temperature": 0.2,
+        "stream": False,
+    }
+    if provider["name"].startswith("ModelScope"):
+        params.update(modelscope_request_options(provider["model"]))
+    return _summarize_sync(client, params)
+
+
 def test_connection() -> bool:
     """Test API connection (primary first, then fallback)."""
     providers = _provider_candidates()
@@ -923,32 +1010,22 @@ def test_connection() -> bool:
         print("❌ 未找到可用 API Key（MODELSCOPE_API_KEY / SILICONFLOW_API_KEY）")
         return False
 
+    # Probe in priority order and stop at the first healthy provider, so a
+    # working primary never spends the paid fallback's quota.
     for provider in providers:
         try:
-            client = create_client(provider["base_url"], provider["api_key"])
-            params: dict[str, Any] = {
-                "model": provider["model"],
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": "你好，请用一句话介绍自己。"},
-                ],
-                "max_tokens": 64,
-                "temperature": 0.2,
-                "stream": False,
-            }
-            if provider["name"].startswith("ModelScope"):
-                params.update(modelscope_request_options(provider["model"]))
-            content = _summarize_sync(client, params)
-            print("✅ API 连接成功！")
-            print(f"   供应商: {provider['name']}")
-            print(f"   模型: {provider['model']}")
-            print(f"   非空正文长度: {len(content)}")
-            return True
+            content = _probe_provider(provider)
         except Exception as exc:
             message = str(exc)
             if provider["api_key"]:
                 message = message.replace(provider["api_key"], "***")
             print(f"⚠️  {provider['name']} 连接失败: {message}")
+            continue
+        print("✅ API 连接成功！")
+        print(f"   供应商: {provider['name']}")
+        print(f"   模型: {provider['model']}")
+        print(f"   非空正文长度: {len(content)}")
+        return True
 
     print("❌ 所有供应商连接失败")
     return False
@@ -1,9 +1,63 @@
 from __future__ import annotations
 
+import io
 import sys
 from pathlib import Path
 
+import pytest
+import requests
+import urllib3
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Keep source HTTP caches out of the shared system temp directory."""
+    from sources.base import BaseSource
+
+    cache_dir = tmp_path / "http-cache"
+    monkeypatch.setattr(BaseSource, "_http_cache_dir", staticmethod(lambda: cache_dir))
+    return cache_dir
+
+
+class FakeHTTPAdapter(requests.adapters.HTTPAdapter):
+    """Serve one canned body for every request and record what was sent."""
+
+    def __init__(
+        self,
+        body: bytes = b"<html>page</html>",
+        content_type: str = "text/html",
+        status: int = 200,
+    ) -> None:
+        super().__init__()
+        self.body = body
+        self.content_type = content_type
+        self.status = status
+        self.requests: list[tuple[str, bool]] = []
+        self.raw: list[urllib3.HTTPResponse] = []
+
+    @property
+    def sent(self) -> int:
+        return len(self.requests)
+
+    def send(self, request, stream=False, **_kwargs):
+        self.requests.append((request.url, stream))
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(self.body),
+            headers={"Content-Type": self.content_type},
+            status=self.status,
+            preload_content=False,
+            request_url=request.url,
+        )
+        self.raw.append(raw)
+        return self.build_response(request, raw)
+
+
+@pytest.fixture
+def fake_http_adapter():
+    """The fake adapter class, for mounting on real source sessions."""
+    return FakeHTTPAdapter
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sources.aibase import AIBaseSource
+
+
+DAILY_PAGE = """<html><body>
+  <a href="#top">skip</a>
+  <a href="/zh/news/123">AI news without a date</a>
+  <a href="/zh/daily/2026-07-16">AI日报：今日模型发布与产品更新汇总</a>
+  <a href="https://example.com/about">About</a>
+</body></html>""".encode()
+
+DETAIL_PAGE = """<html><head><title>Fallback title</title></head><body>
+  <header><h1>AI日报：今日模型发布与产品更新汇总</h1></header>
+  <div class="post-meta"><time datetime="2026-07-16T08:00:00+08:00">today</time></div>
+  <article>
+    <p>2026年7月16号 AI 日报：这是一段超过二十个字符的日报导语，用于摘要提取。</p>
+    <p>第二段同样足够长，描述多个模型和产品的最新进展与影响。</p>
+    <script>ignored()</script>
+  </article>
+</body></html>""".encode()
+
+
+class Response:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    @staticmethod
+    def raise_for_status() -> None:
+        return None
+
+
+def test_fetch_follows_latest_daily_link_and_extracts_detail(monkeypatch) -> None:
+    source = AIBaseSource()
+    requested: list[str] = []
+    pages = {
+        source.DAILY_URL: DAILY_PAGE,
+        "https://news.aibase.com/zh/daily/2026-07-16": DETAIL_PAGE,
+    }
+
+    def get(url, **_kwargs):
+        requested.append(url)
+        return Response(pages[url])
+
+    monkeypatch.setattr(source, "_get", get)
+
+    articles = source.fetch(
+        reference_dt=datetime(2026, 7, 16, 4, 0, tzinfo=timezone.utc),
+    )
+
+    assert requested == [
+        source.DAILY_URL,
+        "https://news.aibase.com/zh/daily/2026-07-16",
+    ]
+    assert len(articles) == 1
+    article = articles[0]
+    assert article.title == "AI日报：今日模型发布与产品更新汇总"
+    assert article.publish_time == "2026-07-16T08:00:00+08:00"
+    assert article.description.startswith("2026年7月16号 AI 日报")
+    assert "第二段同样足够长" in article.content
+    assert article.priority == 1
+    assert article.source == "aibase"
+
+
+def test_fetch_rejects_a_daily_article_from_another_day(monkeypatch) -> None:
+    source = AIBaseSource()
+    monkeypatch.setattr(
+        source,
+        "_get",
+        lambda url, **_kwargs: Response(
+            DAILY_PAGE if url == source.DAILY_URL else DETAIL_PAGE
+        ),
+    )
+
+    assert (
+        source.fetch(reference_dt=datetime(2026, 7, 18, 4, 0, tzinfo=timezone.utc))
+        == []
+    )
+
+
+def test_full_text_without_content_area_skips_script_style_and_noscript() -> None:
+    soup = AIBaseSource()._parse_html(
+        b"""<html><head><style>p { color: red }</style></head><body>
+        <div>first line</div><div>second\n\n\n\nthird</div>
+        <noscript><p>enable javascript</p></noscript><script>ignored()</script>
+        </body></html>"""
+    )
+
+    assert AIBaseSource()._extract_full_text(soup) == "first line\nsecond\n\nthird"
+
+
+def test_latest_link_prefers_dated_daily_urls_and_keeps_first_on_ties() -> None:
+    source = AIBaseSource()
+    soup = source._parse_html(
+        b"""<a href="/zh/news/123456789">A long enough news headline</a>
+        <a href="https://news.aibase.com/zh/daily/2026-07-16">AI daily headline one</a>
+        <a href="//news.aibase.com/zh/daily/2026-07-15">AI daily headline two</a>"""
+    )
+
+    assert source._find_latest_link(soup) == (
+        "https://news.aibase.com/zh/daily/2026-07-16"
+    )
+    assert (
+        source._find_latest_link(source._parse_html(b'<a href="/about">x</a>')) is None
+    )
@@ -33,9 +33,48 @@ def test_atomic_write_preserves_previous_file_when_replace_fails(
     assert list(tmp_path.glob(".report.json.*")) == []
 
 
+def test_atomic_write_streams_extra_chunks_in_order(tmp_path) -> None:
+    target = tmp_path / "report.md"
+
+    storage.atomic_write_text(target, "---\n", "正文", "\n")
+
+    assert target.read_text(encoding="utf-8") == "---\n正文\n"
+    assert list(tmp_path.glob(".report.md.*")) == []
+
+
 def test_json_and_markdown_saves_use_atomic_writer(tmp_path) -> None:
     json_path = storage.save_json(str(tmp_path), "2026-07-10", {"articles": []})
     markdown_path = storage.save_markdown(str(tmp_path), "2026-07-10", "body")
 
     assert json.loads(json_path.read_text(encoding="utf-8")) == {"articles": []}
     assert markdown_path.read_text(encoding="utf-8").endswith("body")
+
+
+def test_json_save_keeps_readable_utf8_layout_and_round_trips(tmp_path) -> None:
+    payload = {"title": "AI 新闻日报", "articles": [{"priority": 1}], "empty": {}}
+
+    path = storage.save_json(str(tmp_path), "2026-07-10", payload)
+
+    assert path.read_text(encoding="utf-8") == (
+        json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+    )
+    assert storage.load_json(str(tmp_path), "2026-07-10") == payload
+    assert storage.load_json(str(tmp_path), "2026-07-11") is None
+
+
+def test_today_helpers_reuse_the_date_until_beijing_midnight(monkeypatch) -> None:
+    # 2026-07-10 15:59:59 UTC is 23:59:59 in Beijing.
+    now = [1783699199.0]
+    monkeypatch.setattr(storage.time, "time", lambda: now[0])
+    monkeypatch.setattr(storage, "_today_cache", (-1, "", ""))
+
+    assert storage.today_ymd() == "2026-07-10"
+    assert storage.today_cn() == "2026年07月10日"
+    cached = storage._today_cache
+
+    assert storage.today_ymd() == "2026-07-10"
+    assert storage._today_cache is cached
+
+    now[0] += 1
+    assert storage.today_ymd() == "2026-07-11"
+    assert storage.today_cn() == "2026年07月11日"
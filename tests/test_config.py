@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import os
+
 import pytest
 
+import config
 from config import Settings, load_config
 
 
@@ -143,3 +146,98 @@ def test_agihunt_trending_rejects_an_impossible_article_contract() -> None:
                 "expected_articles": 15,
             }
         )
+
+
+def test_yaml_parse_is_reused_until_the_file_changes(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("limits:\n  max_articles: 7\n", encoding="utf-8")
+
+    assert load_config(str(config_path)).max_articles == 7
+    hits = config._load_yaml.cache_info().hits
+    assert load_config(str(config_path)).max_articles == 7
+    assert config._load_yaml.cache_info().hits == hits + 1
+
+    config_path.write_text("limits:\n  max_articles: 9\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(str(config_path)).max_articles == 9
+
+
+def test_run_deadline_reads_yaml_unless_the_environment_sets_it(
+    monkeypatch, tmp_path
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("run:\n  deadline_minutes: 45\n", encoding="utf-8")
+    monkeypatch.delenv("RUN_DEADLINE_MINUTES", raising=False)
+
+    assert load_config(str(config_path)).run_deadline_minutes == 45
+
+    monkeypatch.setenv("RUN_DEADLINE_MINUTES", "30")
+    assert load_config(str(config_path)).run_deadline_minutes == 30
+
+
+def test_get_config_is_memoized_until_cache_clear(monkeypatch) -> None:
+    loaded: list[Settings] = []
+
+    def fake_load_config() -> Settings:
+        loaded.append(Settings())
+        return loaded[-1]
+
+    monkeypatch.setattr(config, "load_config", fake_load_config)
+    config.get_config.cache_clear()
+    try:
+        assert config.get_config() is config.get_config()
+        assert len(loaded) == 1
+        config.get_config.cache_clear()
+        assert config.get_config() is loaded[-1]
+        assert len(loaded) == 2
+    finally:
+        config.get_config.cache_clear()
+
+
+def test_env_file_loader_parses_plain_lines_without_overriding(
+    monkeypatch, tmp_path
+) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "# comment\n"
+        "\n"
+        "DR_TEST_PLAIN=plain value # trailing note\n"
+        "export DR_TEST_EXPORTED='quoted # kept'\n"
+        "DR_TEST_EMPTY=\n"
+        "DR_TEST_EXISTING=from-file\n"
+        "not a pair\n",
+        encoding="utf-8",
+    )
+    for key in ("DR_TEST_PLAIN", "DR_TEST_EXPORTED", "DR_TEST_EMPTY"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("DR_TEST_EXISTING", "from-process")
+
+    config._load_env_file(env_path)
+
+    assert os.environ["DR_TEST_PLAIN"] == "plain value"
+    assert os.environ["DR_TEST_EXPORTED"] == "quoted # kept"
+    assert os.environ["DR_TEST_EMPTY"] == ""
+    assert os.environ["DR_TEST_EXISTING"] == "from-process"
+
+    config._load_env_file(env_path, override=True)
+    assert os.environ["DR_TEST_EXISTING"] == "from-file"
+
+
+def test_yaml_key_paths_tolerate_empty_sections_and_legacy_docs_dir(
+    tmp_path,
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "limits:\nsummarize:\n  prompt_path: prompts/custom.md\n"
+        "output:\n  docs_dir: docs\n",
+        encoding="utf-8",
+    )
+
+    cfg = load_config(str(config_path))
+
+    assert cfg.max_articles == 14
+    assert cfg.title_max == 150
+    assert cfg.prompt_path == "prompts/custom.md"
+    assert cfg.site_dir == "docs"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from utils.dedupe import dedupe
+from sources.base import Article
+from utils.dedupe import _identity_key, article_key, dedupe
 
 
 def test_dedupe_collapses_tracking_url_and_title_variants() -> None:
@@ -53,3 +54,40 @@ def test_dedupe_keeps_distinct_stories() -> None:
     ]
 
     assert len(dedupe(articles)) == 2
+
+
+def test_article_key_is_the_canonical_url_or_normalized_title() -> None:
+    tracked = {"title": "Story", "link": "https://Example.com/story/?utm_source=feed"}
+    article = Article(title="Story", link="https://example.com/story")
+
+    assert article_key(tracked) == article_key(article) == "https://example.com/story"
+    assert article_key({"title": "Story", "link": ""}) == article_key(
+        Article(title="story", link="not a url")
+    )
+
+
+def test_dedupe_returns_survivors_by_priority_in_stable_input_order() -> None:
+    articles = [
+        {"title": "Low priority first", "link": "https://a.test/1", "priority": 0},
+        {"title": "High priority story", "link": "https://a.test/2", "priority": 2},
+        Article(title="Article dataclass", link="https://a.test/3", priority=2),
+        {"title": "Another low one", "link": "https://a.test/4"},
+    ]
+
+    assert dedupe(articles) == [articles[1], articles[2], articles[0], articles[3]]
+
+
+def test_repeat_dedupe_reuses_memoized_identity_keys() -> None:
+    articles = [
+        {"title": "Chip startup raises a large round", "link": "https://memo.test/1"},
+        {
+            "title": "Robotics lab opens a new research site",
+            "link": "https://memo.test/2",
+        },
+    ]
+    dedupe(articles)
+    misses = _identity_key.cache_info().misses
+
+    assert dedupe(articles) == articles
+    assert _identity_key.cache_info().misses == misses
+    assert all(set(article) == {"title", "link"} for article in articles)
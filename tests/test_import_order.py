@@ -22,3 +22,23 @@ def test_sources_and_utils_import_without_circular_dependency() -> None:
     )
 
     assert result.returncode == 0, result.stderr
+
+
+def test_cli_import_defers_the_llm_sdk_until_a_client_is_created() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, main, summarizer; "
+                "assert 'openai' not in sys.modules; "
+                "summarizer.create_client('https://example.invalid/v1', 'key'); "
+                "assert 'openai' in sys.modules"
+            ),
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import io
+import threading
+
 import pytest
 import requests
 
-from sources.base import BaseSource
+import sources as source_registry
+from sources.base import Article, BaseSource
 
 
 class Source(BaseSource):
@@ -83,3 +87,169 @@ def test_get_can_use_explicit_environment_proxy_without_trusting_netrc(
 
     assert source.session.trust_env is False
     assert source.session.last_kwargs["proxies"] == proxy
+
+
+def test_fetch_batch_overlaps_sources_and_keeps_configured_order(
+    monkeypatch,
+) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def barrier_source(source_name: str):
+        class BarrierSource:
+            last_attempts = 1
+            last_fetched_count = 1
+            last_status = "ok"
+            last_diagnostics = ()
+
+            def fetch(self, **_kwargs):
+                # Both sources must be in flight at once to pass the barrier.
+                barrier.wait()
+                return [
+                    Article(
+                        title=f"{source_name} story",
+                        link=f"https://example.test/{source_name}",
+                        source=source_name,
+                    )
+                ]
+
+        return BarrierSource
+
+    monkeypatch.setitem(source_registry.REGISTRY, "aibase", barrier_source("aibase"))
+    monkeypatch.setitem(
+        source_registry.REGISTRY, "techcrunch", barrier_source("techcrunch")
+    )
+
+    articles, outcomes = source_registry.fetch_batch(
+        {"techcrunch": True, "missing": True, "aibase": True}
+    )
+
+    assert [article.source for article in articles] == ["techcrunch", "aibase"]
+    assert [(outcome.source, outcome.status) for outcome in outcomes] == [
+        ("techcrunch", "ok"),
+        ("missing", "failed"),
+        ("aibase", "ok"),
+    ]
+
+
+def test_source_session_and_its_cache_are_created_on_first_use(
+    isolated_http_cache,
+) -> None:
+    source = Source()
+    assert not isolated_http_cache.exists()
+
+    assert source.session is source.session
+    assert isolated_http_cache.exists()
+
+
+def test_source_session_ignores_environment_and_keeps_injected_sessions() -> None:
+    source = Source()
+
+    assert source.session.trust_env is False
+    # One pooled adapter serves both schemes, so keep-alive sockets are shared.
+    assert source.session.get_adapter("https://a.test") is (
+        source.session.get_adapter("http://b.test")
+    )
+    assert "gzip" in BaseSource.HEADERS["Accept-Encoding"]
+
+    shared = requests.Session()
+    adapter = shared.get_adapter("https://example.test")
+    assert Source(session=shared).session is shared
+    assert shared.trust_env is True
+    assert shared.get_adapter("https://example.test") is adapter
+
+
+def test_repeat_source_get_is_served_from_the_http_cache(
+    isolated_http_cache, fake_http_adapter
+) -> None:
+    adapter = fake_http_adapter()
+    first = Source()
+    first.session.mount("https://", adapter)
+
+    first._get("https://example.test/page?secret=s3cret", sleep=lambda _: None)
+    second = Source()
+    second.session.mount("https://", adapter)
+    cached = second._get("https://example.test/page?secret=s3cret")
+
+    assert adapter.sent == 1
+    assert cached.from_cache is True
+    assert cached.content == b"<html>page</html>"
+    assert not any(
+        b"s3cret" in path.read_bytes()
+        for path in isolated_http_cache.rglob("*")
+        if path.is_file()
+    )
+
+    BaseSource.clear_cache()
+    third = Source()
+    third.session.mount("https://", adapter)
+    assert third._get("https://example.test/page?secret=s3cret").from_cache is False
+    assert adapter.sent == 2
+
+
+def test_non_html_and_streamed_responses_bypass_the_http_cache(
+    fake_http_adapter,
+) -> None:
+    api = fake_http_adapter(b'{"success": true}', "application/json; charset=utf-8")
+    source = Source()
+    source.session.mount("https://", api)
+    source._get("https://api.example.test/digest")
+    assert source._get("https://api.example.test/digest").from_cache is False
+    assert api.sent == 2
+
+    page = fake_http_adapter(b"<html>" + b"x" * 200_000 + b"</html>")
+    source.session.mount("https://", page)
+    body = source._get_bytes("https://example.test/home", max_bytes=1_000)
+
+    assert len(body) == 1_000
+    # Only the first chunk was pulled off the wire; nothing was written back.
+    assert page.raw[0].tell() < 200_000
+    assert source._get_bytes("https://example.test/home", max_bytes=1_000) == body
+    assert page.sent == 2
+
+
+class BrokenBody(io.BytesIO):
+    def read(self, *args):
+        chunk = super().read(*args)
+        if self.tell() >= 8:
+            raise OSError("connection reset mid-body")
+        return chunk
+
+
+def test_get_bytes_retries_a_body_cut_off_mid_stream(fake_http_adapter) -> None:
+    class FlakyBodyAdapter(fake_http_adapter):
+        def send(self, request, **kwargs):
+            response = super().send(request, **kwargs)
+            if self.sent == 1:
+                response.raw._fp = BrokenBody(self.body)
+            return response
+
+    adapter = FlakyBodyAdapter(b"<html>" + b"x" * 64 + b"</html>")
+    source = Source()
+    source.session.mount("https://", adapter)
+    sleeps = []
+
+    body = source._get_bytes(
+        "https://example.test/home",
+        chunk_size=4,
+        sleep=sleeps.append,
+        random_value=lambda: 0,
+    )
+
+    assert body == adapter.body
+    assert adapter.sent == 2
+    assert source.last_attempts == 2
+    assert sleeps == [0.1]
+
+
+def test_get_bytes_closes_streamed_error_responses_before_retrying(
+    fake_http_adapter,
+) -> None:
+    adapter = fake_http_adapter(b"<html>busy</html>", status=503)
+    source = Source()
+    source.session.mount("https://", adapter)
+
+    with pytest.raises(requests.HTTPError):
+        source._get_bytes("https://example.test/home", sleep=lambda _: None)
+
+    assert adapter.sent == 3
+    assert all(raw.closed for raw in adapter.raw)
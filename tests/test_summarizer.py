@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -407,6 +408,27 @@ def test_summarize_result_records_provider_attempts_and_article_provenance(
     assert result.validation_passed is True
 
 
+def test_summarize_result_sends_compact_article_json(monkeypatch) -> None:
+    monkeypatch.setattr(summarizer, "get_config", _llm_config)
+    monkeypatch.setattr(summarizer, "load_prompt", lambda: "prompt")
+    monkeypatch.setattr(summarizer, "create_client", lambda base_url, api_key: "client")
+    sent: list[str] = []
+
+    def fake_summarize_sync(client, params):
+        sent.append(params["messages"][1]["content"])
+        return _valid_summary()
+
+    monkeypatch.setattr(summarizer, "_summarize_sync", fake_summarize_sync)
+    summarizer.summarize_result(
+        [{"title": "模型发布", "link": "https://example.test/story"}],
+        stream=False,
+    )
+
+    assert "\n" not in sent[0]
+    assert "模型发布" in sent[0]
+    assert json.loads(sent[0])["articles"][0]["article_id"] == "a1"
+
+
 def test_validate_summary_quality_accepts_complete_chinese_digest() -> None:
     summarizer.validate_summary_quality(
         _valid_summary(item_count=10), expected_items=10
@@ -895,3 +917,65 @@ def test_validate_summary_quality_rejects_digest_without_interaction_topic() ->
 
     with pytest.raises(summarizer.SummaryQualityError, match="interaction topic"):
         summarizer.validate_summary_quality(content, expected_items=10)
+
+
+def test_create_client_reuses_provider_clients_and_one_connection_pool() -> None:
+    summarizer._provider_client.cache_clear()
+    primary = summarizer.create_client("https://modelscope.test/v1", "key-a")
+    fallback = summarizer.create_client("https://siliconflow.test/v1", "key-b")
+    bounded = summarizer.create_client(
+        "https://modelscope.test/v1", "key-a", timeout=12.5
+    )
+
+    assert summarizer.create_client("https://modelscope.test/v1", "key-a") is primary
+    assert fallback is not primary
+    assert bounded.timeout == 12.5
+    assert primary.max_retries == 0
+    assert primary._client is fallback._client is bounded._client
+
+
+def test_connection_probes_in_priority_order_and_stops_at_first_healthy(
+    monkeypatch, capsys
+) -> None:
+    monkeypatch.setattr(summarizer, "get_config", _llm_config)
+    monkeypatch.setattr(
+        summarizer,
+        "create_client",
+        lambda base_url, api_key, *, timeout: (base_url, api_key, timeout),
+    )
+    probed: list[str] = []
+
+    def fake_summarize_sync(client, params):
+        probed.append(params["model"])
+        assert client[2] == summarizer._PROBE_TIMEOUT_SECONDS
+        if params["model"] == "ZhipuAI/GLM-5.2":
+            raise RuntimeError("rejected modelscope-key")
+        return "你好"
+
+    monkeypatch.setattr(summarizer, "_summarize_sync", fake_summarize_sync)
+
+    assert summarizer.test_connection() is True
+
+    output = capsys.readouterr().out
+    assert probed == ["ZhipuAI/GLM-5.2", "Tencent-Hunyuan/Hy3"]
+    assert "ModelScope 连接失败: rejected ***" in output
+    assert "供应商: ModelScope secondary" in output
+    assert "SiliconFlow" not in output
+
+
+def test_load_prompt_is_read_once_per_file_revision(monkeypatch, tmp_path) -> None:
+    prompt_path = tmp_path / "daily.md"
+    prompt_path.write_text("first prompt", encoding="utf-8")
+    monkeypatch.setattr(
+        summarizer, "get_config", lambda: _llm_config(prompt_path=str(prompt_path))
+    )
+
+    assert summarizer.load_prompt() == "first prompt"
+    hits = summarizer._read_prompt.cache_info().hits
+    assert summarizer.load_prompt() == "first prompt"
+    assert summarizer._read_prompt.cache_info().hits == hits + 1
+
+    prompt_path.write_text("second prompt", encoding="utf-8")
+    stat = prompt_path.stat()
+    os.utime(prompt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert summarizer.load_prompt() == "second prompt"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from sources._tz import beijing_tz
+from sources.techcrunch import TechCrunchSource
+
+
+HOMEPAGE = b"""<!doctype html>
+<html>
+<body>
+  <div class="post-block">
+    <h2><a href="/2026/07/16/openai-ships-agent/">OpenAI ships a new <b>agent</b></a></h2>
+  </div>
+  <article>
+    <h3><a href="https://techcrunch.com/2026/07/15/google-ai-platform/">Google updates its AI platform</a></h3>
+  </article>
+  <h2><a href="/2026/07/16/openai-ships-agent/?utm_source=river">Duplicate homepage slot</a></h2>
+  <h2><a href="/2026/07/10/old-story/">This old story must be filtered out</a></h2>
+  <h2><a href="/2026/07/16/tiny/">Short</a></h2>
+  <h2><a href="https://example.com/2026/07/16/external/">External links are not TechCrunch</a></h2>
+  <h2><a href="/category/ai/">Category pages have no dated URL</a></h2>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def homepage_source(fake_http_adapter):
+    source = TechCrunchSource()
+    adapter = fake_http_adapter(HOMEPAGE)
+    source.session.mount("https://", adapter)
+    return source, adapter
+
+
+def test_fetch_extracts_recent_dated_homepage_links(homepage_source) -> None:
+    source, adapter = homepage_source
+
+    articles = source.fetch(
+        max_articles=14,
+        reference_dt=datetime(2026, 7, 16, 4, 0, tzinfo=timezone.utc),
+    )
+
+    assert adapter.requests == [(source.BASE_URL + "/", True)]
+    assert [(article.title, article.link) for article in articles] == [
+        (
+            "OpenAI ships a newagent",
+            "https://techcrunch.com/2026/07/16/openai-ships-agent/",
+        ),
+        (
+            "Google updates its AI platform",
+            "https://techcrunch.com/2026/07/15/google-ai-platform/",
+        ),
+        (
+            "Duplicate homepage slot",
+            "https://techcrunch.com/2026/07/16/openai-ships-agent/?utm_source=river",
+        ),
+    ]
+    assert articles[0].publish_time == "2026-07-16"
+    assert all(article.kind == "lead" for article in articles)
+    assert all(article.priority == 1 for article in articles)
+
+
+def test_fetch_honors_article_limit(homepage_source) -> None:
+    source, _adapter = homepage_source
+
+    articles = source.fetch(
+        max_articles=1,
+        reference_dt=datetime(2026, 7, 16, 4, 0, tzinfo=timezone.utc),
+    )
+
+    assert len(articles) == 1
+
+
+def test_story_anchors_come_from_blocks_headings_and_dated_links() -> None:
+    source = TechCrunchSource()
+    tree = source._parse_html_fast(
+        b"""<div class="river-block wide"><h2><a href="/2024/01/02/block/">Story in a
+        river block</a></h2></div>
+        <nav><a href="/2024/01/02/nav/">Undated navigation link</a>
+        <a href="/2026/01/02/dated/">Dated link outside any block</a></nav>"""
+    )
+
+    assert [article.link for article in source._parse_articles(tree, frozenset())] == [
+        "https://techcrunch.com/2024/01/02/block/",
+        "https://techcrunch.com/2026/01/02/dated/",
+    ]
+
+
+def test_get_bytes_stops_reading_at_the_page_cap(homepage_source) -> None:
+    source, _adapter = homepage_source
+
+    body = source._get_bytes(source.BASE_URL, max_bytes=100, chunk_size=64)
+
+    assert body == HOMEPAGE[:100]
+
+
+def test_recent_window_is_today_and_yesterday_in_beijing() -> None:
+    # 2026-07-16 20:00 UTC is already 2026-07-17 in Beijing.
+    reference = datetime(2026, 7, 16, 20, 0, tzinfo=timezone.utc)
+
+    assert TechCrunchSource._build_recent_set(
+        beijing_tz, days=1, reference_dt=reference
+    ) == frozenset({"2026-07-17", "2026-07-16"})
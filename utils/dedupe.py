@@ -5,13 +5,18 @@ Removes duplicate articles based on canonical URL and obvious story-title rewrit
 
 from __future__ import annotations
 from difflib import SequenceMatcher
-import hashlib
+import functools
 from urllib.parse import urlparse
 from typing import List
 
 from article_identity import canonical_url, normalize_title
 from sources.base import Article
 
+# Keys depend only on (link, title), so they are memoized on those strings
+# instead of being stored on Articles or on dicts that are later saved.
+_KEY_CACHE_SIZE = 4096
+_normalized_title = functools.lru_cache(maxsize=_KEY_CACHE_SIZE)(normalize_title)
+
 
 def get_domain(url: str) -> str:
     """Extract domain from URL"""
@@ -22,7 +27,11 @@ def get_domain(url: str) -> str:
 
 
 def article_key(article: Article | dict) -> str:
-    """Generate unique key for article"""
+    """Generate unique key for article.
+
+    The canonical URL (or normalized title) is itself the key; it only lives
+    in an in-process set, so hashing it first would add work, not uniqueness.
+    """
     if isinstance(article, Article):
         title = article.title
         link = article.link
@@ -30,15 +39,24 @@ def article_key(article: Article | dict) -> str:
         title = article.get("title", "")
         link = article.get("link", "")
 
-    normalized_url = canonical_url(link)
-    base = normalized_url or normalize_title(title)
-    return hashlib.md5(base.encode("utf-8")).hexdigest()
+    return _identity_key(link, title)
+
+
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _identity_key(link: str, title: str) -> str:
+    return canonical_url(link) or _normalized_title(title)
+
+
+def _priority(article: Article | dict) -> int:
+    if isinstance(article, Article):
+        return article.priority
+    return article.get("priority", 0)
 
 
 def _same_story(left_title: str, right_title: str) -> bool:
     """Catch only obvious cross-source title rewrites."""
-    left = normalize_title(left_title)
-    right = normalize_title(right_title)
+    left = _normalized_title(left_title)
+    right = _normalized_title(right_title)
     if not left or not right:
         return False
     if left == right:
@@ -54,13 +72,9 @@ def dedupe(articles: List[Article | dict]) -> List[Article | dict]:
     Higher priority articles are kept when duplicates are found
     """
 
-    # Sort by priority (high first)
-    def get_priority(a):
-        if isinstance(a, Article):
-            return a.priority
-        return a.get("priority", 0)
-
-    sorted_articles = sorted(articles, key=get_priority, reverse=True)
+    # Sort by priority (high first); the sort is stable, so equal priorities
+    # keep their input order and survivors stay in this order.
+    sorted_articles = sorted(articles, key=_priority, reverse=True)
 
     seen = set()
     seen_titles: list[str] = []
@@ -79,5 +93,4 @@ def dedupe(articles: List[Article | dict]) -> List[Article | dict]:
         seen_titles.append(title)
         result.append(article)
 
-    # Return sorted by priority
-    return sorted(result, key=get_priority, reverse=True)
+    return result
@@ -15,6 +15,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 CATALOG_PATH = Path(__file__).resolve().parents[1] / "editorial_catalog.yaml"
 _ASCII_WORD = re.compile(r"[a-z0-9]", re.IGNORECASE)
@@ -86,7 +91,9 @@ def _term_mapping(value: Any, label: str) -> dict[str, tuple[str, ...]]:
 def load_editorial_catalog() -> EditorialCatalog:
     """Load and validate the versioned editorial catalog once per process."""
 
-    payload = yaml.safe_load(CATALOG_PATH.read_text(encoding="utf-8")) or {}
+    payload = (
+        yaml.load(CATALOG_PATH.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
+    )
     if not isinstance(payload, dict):
         raise ValueError("editorial catalog root must be a mapping")
     raw_entities = payload.get("entities")
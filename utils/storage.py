@@ -4,30 +4,56 @@ Handles saving JSON data and Markdown files
 """
 
 from __future__ import annotations
-import json
 import os
 from pathlib import Path
 import tempfile
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
+import orjson
+
+_JSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+)
+
 # Beijing timezone
 beijing_tz = timezone(timedelta(hours=8))
+_BEIJING_OFFSET_SECONDS = 8 * 3600
+_SECONDS_PER_DAY = 86400
+
+# (epoch day in Beijing time, YYYY-MM-DD, Chinese date); swapped as one tuple.
+_today_cache: tuple[int, str, str] = (-1, "", "")
+
+
+def _today_strings() -> tuple[str, str]:
+    global _today_cache
+    now = time.time()
+    epoch_day = int((now + _BEIJING_OFFSET_SECONDS) // _SECONDS_PER_DAY)
+    cached = _today_cache
+    if cached[0] != epoch_day:
+        d = datetime.fromtimestamp(now, beijing_tz)
+        cached = (
+            epoch_day,
+            d.strftime("%Y-%m-%d"),
+            f"{d.year}年{d.month:02d}月{d.day:02d}日",
+        )
+        _today_cache = cached
+    return cached[1], cached[2]
 
 
 def today_ymd(clock=None) -> str:
     """Get today's date in YYYY-MM-DD format (Beijing time)"""
     if clock is not None:
         return clock.report_date_ymd
-    return datetime.now(beijing_tz).strftime("%Y-%m-%d")
+    return _today_strings()[0]
 
 
 def today_cn(clock=None) -> str:
     """Get today's date in Chinese format"""
     if clock is not None:
         return clock.report_date_cn
-    d = datetime.now(beijing_tz)
-    return f"{d.year}年{d.month:02d}月{d.day:02d}日"
+    return _today_strings()[1]
 
 
 def ensure_dir(path: str | Path) -> Path:
@@ -37,8 +63,12 @@ def ensure_dir(path: str | Path) -> Path:
     return p
 
 
-def atomic_write_bytes(path: str | Path, content: bytes) -> Path:
-    """Replace one file only after fully writing and syncing a sibling temp file."""
+def atomic_write_bytes(path: str | Path, content: bytes, *more: bytes) -> Path:
+    """Replace one file only after fully writing and syncing a sibling temp file.
+
+    Extra ``more`` chunks are written after ``content`` in order, so callers
+    need not join a header and body into one buffer first.
+    """
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
     fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
@@ -46,6 +76,8 @@ def atomic_write_bytes(path: str | Path, content: bytes) -> Path:
     try:
         with os.fdopen(fd, "wb") as handle:
             handle.write(content)
+            for chunk in more:
+                handle.write(chunk)
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temp_path, target)
@@ -65,24 +97,25 @@ def atomic_write_bytes(path: str | Path, content: bytes) -> Path:
         raise
 
 
-def atomic_write_text(path: str | Path, content: str) -> Path:
+def atomic_write_text(path: str | Path, content: str, *more: str) -> Path:
     """UTF-8 convenience wrapper around :func:`atomic_write_bytes`."""
-    return atomic_write_bytes(path, content.encode("utf-8"))
+    return atomic_write_bytes(
+        path, content.encode("utf-8"), *(chunk.encode("utf-8") for chunk in more)
+    )
 
 
 def save_json(dir_path: str, date_str: str, data: Any) -> Path:
     """Save data as JSON file"""
     ensure_dir(dir_path)
     fp = Path(dir_path) / f"{date_str}.json"
-    return atomic_write_text(fp, json.dumps(data, ensure_ascii=False, indent=2) + "\n")
+    return atomic_write_bytes(fp, orjson.dumps(data, option=_JSON_OPTIONS))
 
 
 def load_json(dir_path: str, date_str: str) -> dict | None:
     """Load JSON file if exists"""
     fp = Path(dir_path) / f"{date_str}.json"
     if fp.exists():
-        with open(fp, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(fp.read_bytes())
     return None
 
 
@@ -98,4 +131,4 @@ date: {date_str}
 ---
 
 """
-    return atomic_write_text(fp, frontmatter + content)
+    return atomic_write_text(fp, frontmatter, content)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import date, datetime, timedelta
 from email.utils import parsedate_to_datetime
@@ -10,6 +9,8 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+import orjson
+
 
 _SPACE_RE = re.compile(r"\s+")
 _NON_EVIDENCE_HOSTS = {
@@ -201,8 +202,8 @@ def remove_recent_exact_duplicates(
         if not path.is_file():
             continue
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            payload = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             continue
         checked_days.append(day.isoformat())
         summary = payload.get("summary") if isinstance(payload, dict) else None